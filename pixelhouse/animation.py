@@ -2,13 +2,36 @@ from . import Canvas, Artist
 from .motion import easing
 
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import os
+import warnings
 import numpy as np
 import scipy.interpolate
 
 from tqdm import tqdm
 
+# Frames can be rendered on several threads since cv2 releases the GIL while
+# it draws and composites. Off by default, artists may depend on draw order.
+_RENDER_THREADS_ENV = "PIXELHOUSE_THREADS"
+
+
+def _default_render_threads():
+    """
+    Number of render threads from the environment, 1 if unset or invalid.
+    """
+    value = os.environ.get(_RENDER_THREADS_ENV, "1")
+
+    try:
+        return max(1, int(value))
+    except ValueError:
+        msg = (
+            f"{_RENDER_THREADS_ENV}={value!r} is not an integer, "
+            f"rendering on a single thread."
+        )
+        warnings.warn(msg)
+        return 1
+
 
 class Animation:
     def __init__(
@@ -116,22 +139,41 @@ class Animation:
 
         return self
 
-    def render_all(self):
-        for n in range(len(self)):
-            self.render(n)
+    def render_all(self, threads=None):
+        """
+        Renders every frame. With threads > 1 (default from the environment
+        variable PIXELHOUSE_THREADS) the frames are drawn in parallel.
+
+        Frames drawn in parallel don't pass their shared_attributes on to
+        the next frame, each frame starts with its own.
+        """
+        if threads is None:
+            threads = _default_render_threads()
+
+        if threads <= 1:
+            for n in range(len(self)):
+                self.render(n)
+            return
+
+        todo = [n for n in range(len(self)) if not self.has_rendered[n]]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(self._draw_frame, todo))
+
+    def _draw_frame(self, n):
+        t = self.timepoints[n]
+
+        artists = self.artist_stack[self.keyframes[n]]
+        for art in artists:
+            art.draw(self.frames[n], t)
+
+        self.has_rendered[n] = True
 
     def render(self, n):
         assert 0 <= n < len(self)
 
         if not self.has_rendered[n]:
 
-            t = self.timepoints[n]
-
-            artists = self.artist_stack[self.keyframes[n]]
-            for art in artists:
-                art.draw(self.frames[n], t)
-
-            self.has_rendered[n] = True
+            self._draw_frame(n)
 
             # Copy any shared attributes to the next frame
             if n < len(self) - 1:
@@ -143,6 +185,8 @@ class Animation:
 
     def show(self, delay=50, repeat=True):  # pragma: no cover
 
+        self.render_all()
+
         is_status_bar = True
         while True:
             if is_status_bar:
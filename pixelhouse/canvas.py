@@ -1,4 +1,6 @@
 from contextlib import contextmanager
+import functools
+import threading
 import cv2
 import os
 import numpy as np
@@ -7,6 +9,39 @@ from . import Artist
 from .color import matplotlib_colors
 
 
+@functools.lru_cache(maxsize=256)
+def _named_color(name):
+    """
+    Looks up a color name or hex code as a tuple. Draw calls reuse the
+    same few colors, so the lookups are cached.
+    """
+    return tuple(matplotlib_colors(name))
+
+
+_scratch = threading.local()
+
+# Largest image (in pixels) whose scratch buffers are kept between calls,
+# bigger ones are allocated per call so they don't stay alive on the thread
+_SCRATCH_PIXELS = 1920 * 1080
+
+
+def _blend_weights(height, width):
+    """
+    Two float32 (height, width) work buffers for the blend weights. They are
+    reused across blends on the same thread up to _SCRATCH_PIXELS.
+    """
+    size = height * width
+    buf = getattr(_scratch, "weights", None)
+
+    if size > _SCRATCH_PIXELS:
+        buf = np.empty((2, size), np.float32)
+    elif buf is None or buf.shape[1] < size:
+        buf = _scratch.weights = np.empty((2, size), np.float32)
+
+    w = buf[:, :size]
+    return w[0].reshape(height, width), w[1].reshape(height, width)
+
+
 class Canvas:
     """
     Basic canvas object for pixelhouse drawings. 
@@ -32,25 +67,37 @@ class Canvas:
         self.bg = bg
 
         if img is None:
-            # Empty canvas
-            self._img = np.zeros((height, width, 4), np.uint8)
+            # Empty canvas, filled in one pass by viewing each RGBA pixel
+            # as a single uint32 (the byte order matches on any platform)
             self.bg[3] = 0
-            self.img = self.bg
+            self._img = np.empty((height, width, 4), np.uint8)
+            self._img.view(np.uint32)[:] = self.bg.view(np.uint32)
 
         else:
             # If a single channel image, upcast to greyscale
             if len(img.shape) == 2:
-                img = np.dstack([img, img, img])
-
-            # If rgb, add the alpha channel
-            if img.shape[2] == 3:
-                alpha = np.zeros_like(img[:, :, 0])
-                img = np.dstack([img, alpha])
+                img = img[:, :, np.newaxis]
+
+            # If grey or rgb, copy once into an image with a transparent
+            # alpha channel (the grey values broadcast across rgb)
+            if img.shape[2] < 4:
+                rgba = np.empty(img.shape[:2] + (4,), img.dtype)
+                rgba[:, :, :3] = img
+                rgba[:, :, 3] = 0
+                img = rgba
             self._img = img
 
+        # Keep the resolved background as a tuple, blank canvases reuse it
+        # without converting the color again
+        self._bg_rgba = tuple(self.bg.tolist())
+
         self.name = name
         self.extent = extent
 
+        # Pixel transform coefficients, filled lazily by _affine
+        self._affine_key = None
+        self._affine_coef = None
+
         # When animating, we may want to pass attributes from one canvas
         # to another. Do so in the shared_attributes
         self.shared_attributes = {}
@@ -162,7 +209,7 @@ class Canvas:
             Does not modify in place.
         """
         if bg is None:
-            bg = self.bg
+            bg = self._bg_rgba
 
         cvs = Canvas(self.width, self.height, extent=self.extent, bg=bg)
         return cvs
@@ -172,13 +219,26 @@ class Canvas:
             Returns a deep copy of this canvas
         """
         cvs = self.blank()
-        cvs.img = self.img.copy()
+
+        # Reuse the blank buffer, unless the image has a different dtype
+        if self.img.dtype == cvs.img.dtype:
+            self.copy_into(cvs.img)
+        else:
+            cvs._img = self.img.copy()
 
         if transparent:
             cvs.alpha = 0
 
         return cvs
 
+    def copy_into(self, out):
+        """
+            Copies the image into an existing (height, width, 4) array,
+            so a caller can reuse the same buffer for many canvases.
+        """
+        np.copyto(out, self.img)
+        return out
+
     def __call__(self, art=None):
         """
             Calls an Artist on the canvas.
@@ -233,7 +293,13 @@ class Canvas:
 
         return self
 
-    def cv2_draw(self, func, args, mode, **kwargs):
+    def cv2_draw(self, func, args, mode, bbox=None, roi_args=None, **kwargs):
+        """
+        Draws with a cv2 function, either directly or onto a blank canvas
+        that is combined with this one. If the pixel bounds (x0, y0, x1, y1)
+        of the drawing are known, roi_args(x0, y0) must return args shifted
+        to that origin and only the bounding box is allocated and combined.
+        """
 
         if mode == "direct":
             func(self.img, *args)
@@ -241,6 +307,28 @@ class Canvas:
             rhs = self.blank()
             func(rhs.img, *args)
             kwargs["gradient"](self, t=kwargs["t"], mask=rhs)
+        elif (
+            bbox is not None
+            and roi_args is not None
+            and mode in ("blend", "add", "subtract")
+            # Outside of the box add/subtract would still apply the bg color
+            and (mode == "blend" or not any(self._bg_rgba[:3]))
+            # The box is combined through a view, it must be written in place
+            and self._is_packed()
+        ):
+            x0, y0, x1, y1 = bbox
+            x0, y0 = max(x0, 0), max(y0, 0)
+            x1, y1 = min(x1, self.width), min(y1, self.height)
+
+            # Nothing to draw if the shape is off the canvas
+            if x0 >= x1 or y0 >= y1:
+                return self
+
+            rhs = Canvas(x1 - x0, y1 - y0, extent=self.extent, bg=self._bg_rgba)
+            func(rhs.img, *roi_args(x0, y0))
+
+            lhs = Canvas(img=self._img[y0:y1, x0:x1], extent=self.extent)
+            lhs.combine(rhs, mode)
         else:
             rhs = self.blank()
             func(rhs.img, *args)
@@ -248,21 +336,86 @@ class Canvas:
 
         return self
 
+    def _is_packed(self):
+        """
+        True if cv2 can write into the image in place: uint8 with packed
+        pixels, the rows may be strided (e.g. a region of a larger image).
+        """
+        img = self._img
+        return img.dtype == np.uint8 and img.strides[1:] == (self.channels, 1)
+
     def blend(self, rhs):
-        # Smooth the image based off the alpha from the mask image
+        # Smooth the image based off the alpha from the mask image.
+        # blendLinear is a single SIMD pass over the uint8 pixels computing
+        # (rhs*a + img*(255-a)) / 255, with a broadcast across the channels.
+
+        # Images that aren't uint8 blend in float, rounding down as before
+        if self._img.dtype != np.uint8 or rhs.img.dtype != np.uint8:
+            a = rhs.alpha[:, :, np.newaxis].astype(np.float32) / 255
+            MX = (1 - a) * self.img + a * rhs.img
+            self.img = np.clip(MX, 0, 255).astype(np.uint8)
+            return self
+
+        if not self._is_packed():
+            self._img = np.ascontiguousarray(self._img)
 
-        a = rhs.alpha.reshape(self.height, self.width, -1).astype(np.float32)
-        a /= 255
+        # Only blend the rows that aren't fully transparent in the mask
+        a = rhs.alpha
+        rows = np.flatnonzero(a.any(axis=1))
 
-        MX = (1 - a) * self.img + a * rhs.img
-        MX = np.clip(MX, 0, 255).astype(np.uint8)
-        self.img = MX
+        if not rows.size:
+            return self
+
+        y0, y1 = rows[0], rows[-1] + 1
+        a = a[y0:y1]
+        src, dst = rhs.img[y0:y1], self._img[y0:y1]
+
+        # A fully opaque mask is just a copy
+        if a.min() == 255:
+            np.copyto(dst, src)
+            return self
+
+        w1, w2 = _blend_weights(*a.shape)
+        np.copyto(w1, a)
+        np.subtract(255, w1, out=w2)
+        cv2.blendLinear(src, dst, w1, w2, dst)
 
         return self
 
+    def _affine(self):
+        """
+        Coefficients (sx, cx, sy, cy) mapping model coordinates to pixels,
+        px = x*sx + cx and py = y*sy + cy. Recomputed if the image is
+        resized or the extent changes.
+        """
+        key = (self._img.shape, self.extent)
+
+        if self._affine_key != key:
+            sx = self.pixels_per_unit
+            self._affine_coef = (sx, self.width / 2, -sx, self.height / 2)
+            self._affine_key = key
+
+        return self._affine_coef
+
+    def transform_xy(self, xs, ys, use_shift=False):
+        """
+        Vectorised transform_x/transform_y for arrays of points.
+        Returns the discrete pixel coordinates as two int32 arrays.
+        """
+        sx, cx, sy, cy = self._affine()
+
+        if use_shift and self.shift:
+            scale = 2 ** self.shift
+            sx, cx, sy, cy = sx * scale, cx * scale, sy * scale, cy * scale
+
+        xs = np.asarray(xs, dtype=float) * sx + cx
+        ys = np.asarray(ys, dtype=float) * sy + cy
+
+        return xs.astype(np.int32), ys.astype(np.int32)
+
     def transform_x(self, x, is_discrete=True, use_shift=False):
-        x += self.extent
-        x *= self.pixels_per_unit
+        sx, cx, _, _ = self._affine()
+        x = x * sx + cx
 
         if is_discrete:
             if use_shift and self.shift:
@@ -277,7 +430,7 @@ class Canvas:
         return x
 
     def transform_length(self, r, is_discrete=True, use_shift=False):
-        r *= float(self.width) / self.extent / 2
+        r = r * self._affine()[0]
 
         if use_shift and self.shift:
             r *= 2 ** self.shift
@@ -287,9 +440,8 @@ class Canvas:
         return r
 
     def transform_y(self, y, is_discrete=True, use_shift=False):
-        y *= -1
-        y += self.extent / self.aspect_ratio
-        y *= self.pixels_per_unit
+        _, _, sy, cy = self._affine()
+        y = y * sy + cy
 
         if is_discrete:
             if use_shift and self.shift:
@@ -305,15 +457,10 @@ class Canvas:
         return y
 
     def transform_kernel_length(self, r):
-        # Kernels must be positive and odd integers
-        r = self.transform_length(r, is_discrete=False)
-
-        remainder = r % 2
-        r = int(r - r % 2)
-        r += -1 if remainder < 1 else 1
-
-        r = max(1, r)
-        return r
+        # Kernels must be positive and odd integers, round down to the
+        # largest odd integer <= r by setting the low bit of int(r) - 1
+        r = int(self.transform_length(r, is_discrete=False))
+        return max(1, (r - 1) | 1)
 
     def transform_thickness(self, r):
         # If thickness is negative, leave it alone
@@ -324,21 +471,21 @@ class Canvas:
 
     def transform_color(self, c):
         """
-        Cleanly transform a color.
+        Cleanly transform a color, returned as an RGBA tuple.
         """
 
         if isinstance(c, str):
-            c = matplotlib_colors(c)
-
-        # Force add in the alpha channel
-        if len(c) == 3:
-            c = list(c) + [255]
+            c = _named_color(c)
 
         # Force the return of a scalar (cv2 is picky)
         if isinstance(c, np.ndarray):
             c = c.tolist()
 
-        return c
+        # Force add in the alpha channel
+        if len(c) == 3:
+            return tuple(c) + (255,)
+
+        return tuple(c)
 
     def grid_coordinates(self):
 
@@ -391,6 +538,22 @@ class Canvas:
             return cv2.LINE_AA
         return 8
 
+    def _bgr(self):
+        """
+        Returns the image as BGR for cv2 output. The result is written into
+        a buffer shared by every canvas on this thread (up to _SCRATCH_PIXELS),
+        so use it right away.
+        """
+        shape = (self.height, self.width, 3)
+        buf = getattr(_scratch, "bgr", None)
+
+        if self.height * self.width > _SCRATCH_PIXELS:
+            buf = np.empty(shape, np.uint8)
+        elif buf is None or buf.shape != shape:
+            buf = _scratch.bgr = np.empty(shape, np.uint8)
+
+        return cv2.cvtColor(self.img, cv2.COLOR_RGB2BGR, dst=buf)
+
     def show(
         self, delay=0, orient=False, return_status=False
     ):  # pragma: no cover
@@ -402,7 +565,7 @@ class Canvas:
         """
 
         # Before we show we have to convert back to BGR
-        dst = cv2.cvtColor(self.img, cv2.COLOR_RGB2BGR)
+        dst = self._bgr()
 
         cv2.imshow(self.name, dst)
 
@@ -422,7 +585,7 @@ class Canvas:
         """
 
         # Before we save we have to convert back to BGR
-        dst = cv2.cvtColor(self.img, cv2.COLOR_RGB2BGR)
+        dst = self._bgr()
         cv2.imwrite(filename, dst)
 
         return self
@@ -439,12 +602,12 @@ class Canvas:
         # Read the image in and convert to RGB space
         img = cv2.imread(filename, cv2.IMREAD_UNCHANGED)
 
-        # If needed, add in an alpha channel as fully opaque
+        # If needed, add in an alpha channel as fully opaque. cvtColor
+        # does this in the same pass as the channel swap.
         if img.shape[2] == 3:
-            alpha = 255 * np.ones_like(img[:, :, 0])
-            img = np.dstack((img, alpha))
-
-        self.img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
+            self._img = cv2.cvtColor(img, cv2.COLOR_BGR2RGBA)
+        else:
+            self._img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
 
         return self
 
@@ -39,7 +39,7 @@ class linear(Artist):
         )
 
         for c, z in ITR:
-            cval = cvs.transform_color(c).copy()
+            cval = list(cvs.transform_color(c))
             if z is not None:
                 cval[-1] = (np.clip(z, 0, 1) * 255).astype(np.uint8)
             colors.append(cval)
@@ -56,7 +56,7 @@ class linear(Artist):
         pro /= pro.max()
 
         # Smooth the image based off the alpha from the mask image
-        alpha = (mask.alpha / 255.0)[mask_idx]
+        alpha = mask.alpha[mask_idx] / 255.0
 
         imode = self.interpolation(t)
         if imode == "LAB":
@@ -68,7 +68,8 @@ class linear(Artist):
         else:
             raise KeyError(f"Unknown interpolation {imode}")
 
-        # Blend the new shape in
-        rhs = cvs.copy()
+        # Blend the new shape in, everything outside the mask is left
+        # transparent so blend can skip it
+        rhs = cvs.blank()
         rhs.img[mask_idx] = C
         cvs.blend(rhs)
@@ -14,6 +14,7 @@ import os
 def canvas2gif(
     A, f_gif, palettesize=256, gifsicle=False, duration=None
 ):  # pragma: no cover
+    A.render_all()
     images = [A.render(n).img for n in tqdm(range(len(A)))]
 
     if duration == None:
@@ -39,6 +40,8 @@ def canvas2gif(
 
 def canvas2mp4(A, f_mp4, loop=1):  # pragma: no cover
 
+    A.render_all()
+
     with tempfile.TemporaryDirectory() as tmp_dir:
 
         for n, img in tqdm(enumerate(A.frames)):
@@ -42,6 +42,31 @@ class PrimitiveArtist(Artist):
 
         return x, y, thickness, color, lineType, mode
 
+    @staticmethod
+    def bounding_box(xs, ys, thickness, shift):
+        """
+        Pixel bounds (x0, y0, x1, y1) around points given in cv2 fixed-point
+        units, padded for the line thickness and antialiased edges.
+        """
+        pad = max(thickness, 0) + 2
+        x0, x1 = int(np.min(xs)) >> shift, int(np.max(xs)) >> shift
+        y0, y1 = int(np.min(ys)) >> shift, int(np.max(ys)) >> shift
+        return x0 - pad, y0 - pad, x1 + pad + 1, y1 + pad + 1
+
+    @staticmethod
+    def move_points(args, n, shift):
+        """
+        Returns a function that moves the leading n (x, y) points of the
+        cv2 args to a new pixel origin, used by cv2_draw to draw in a box.
+        """
+
+        def func(dx, dy):
+            dx, dy = dx << shift, dy << shift
+            pts = tuple((x - dx, y - dy) for x, y in args[:n])
+            return pts + tuple(args[n:])
+
+        return func
+
 
 class circle(PrimitiveArtist):
     """
@@ -72,7 +97,19 @@ class circle(PrimitiveArtist):
         r = max(0, r)
 
         args = (x, y), r, color, thickness, lineType, cvs.shift
-        cvs.cv2_draw(cv2.circle, args, mode=mode, gradient=self.gradient, t=t)
+        bbox = self.bounding_box(
+            (x - r, x + r), (y - r, y + r), thickness, cvs.shift
+        )
+
+        cvs.cv2_draw(
+            cv2.circle,
+            args,
+            mode=mode,
+            gradient=self.gradient,
+            t=t,
+            bbox=bbox,
+            roi_args=self.move_points(args, 1, cvs.shift),
+        )
 
 
 class rectangle(PrimitiveArtist):
@@ -103,8 +140,16 @@ class rectangle(PrimitiveArtist):
         y1 = cvs.transform_y(self.y1(t), use_shift=True)
 
         args = (x, y), (x1, y1), color, thickness, lineType, cvs.shift
+        bbox = self.bounding_box((x, x1), (y, y1), thickness, cvs.shift)
+
         cvs.cv2_draw(
-            cv2.rectangle, args, mode=mode, gradient=self.gradient, t=t
+            cv2.rectangle,
+            args,
+            mode=mode,
+            gradient=self.gradient,
+            t=t,
+            bbox=bbox,
+            roi_args=self.move_points(args, 2, cvs.shift),
         )
 
 
@@ -140,7 +185,17 @@ class line(PrimitiveArtist):
         thickness = max(thickness, 1)
 
         args = (x, y), (x1, y1), color, thickness, lineType, cvs.shift
-        cvs.cv2_draw(cv2.line, args, mode=mode, gradient=self.gradient, t=t)
+        bbox = self.bounding_box((x, x1), (y, y1), thickness, cvs.shift)
+
+        cvs.cv2_draw(
+            cv2.line,
+            args,
+            mode=mode,
+            gradient=self.gradient,
+            t=t,
+            bbox=bbox,
+            roi_args=self.move_points(args, 2, cvs.shift),
+        )
 
 
 class ellipse(PrimitiveArtist):
@@ -205,7 +260,21 @@ class ellipse(PrimitiveArtist):
             cvs.shift,
         )
 
-        cvs.cv2_draw(cv2.ellipse, args, mode=mode, gradient=self.gradient, t=t)
+        # Rotated or not, the ellipse fits in a circle of the major axis
+        r = max(a, b)
+        bbox = self.bounding_box(
+            (x - r, x + r), (y - r, y + r), thickness, cvs.shift
+        )
+
+        cvs.cv2_draw(
+            cv2.ellipse,
+            args,
+            mode=mode,
+            gradient=self.gradient,
+            t=t,
+            bbox=bbox,
+            roi_args=self.move_points(args, 1, cvs.shift),
+        )
 
 
 class polyline(PrimitiveArtist):
@@ -244,8 +313,7 @@ class polyline(PrimitiveArtist):
 
     def draw(self, cvs, t=0.0):
 
-        xpts = cvs.transform_x(np.array(self.xpts(t)), False)
-        ypts = cvs.transform_y(np.array(self.ypts(t)), False)
+        xpts, ypts = cvs.transform_xy(self.xpts(t), self.ypts(t))
 
         thickness = cvs.transform_thickness(self.thickness(t))
         color = cvs.transform_color(self.color(t))
@@ -253,17 +321,25 @@ class polyline(PrimitiveArtist):
         is_closed = self.is_closed(t)
         mode = self.mode(t)
 
-        pts = np.vstack([xpts, ypts]).T.astype(np.int32)
+        pts = np.stack([xpts, ypts], axis=1)
 
         if self.gradient(t) is not None:
             raise NotImplementedError("Can't use gradients on polylines yet")
 
+        # Polylines are drawn without a fixed-point shift
+        bbox = self.bounding_box(xpts, ypts, thickness, 0)
+
+        def moved(args):
+            return lambda dx, dy: ([pts - (dx, dy)],) + args[1:]
+
         if not self.is_filled(t):
             args = [pts], is_closed, color, thickness, lineType, 0
-            cvs.cv2_draw(cv2.polylines, args, mode=mode)
+            cvs.cv2_draw(
+                cv2.polylines, args, mode, bbox=bbox, roi_args=moved(args)
+            )
 
         args = [pts], color, lineType, 0
-        cvs.cv2_draw(cv2.fillPoly, args, mode=mode)
+        cvs.cv2_draw(cv2.fillPoly, args, mode, bbox=bbox, roi_args=moved(args))
 
 
 class text(PrimitiveArtist):
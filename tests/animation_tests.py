@@ -2,6 +2,8 @@ from nose.tools import *
 
 import pixelhouse as ph
 import numpy as np
+import os
+import warnings
 
 
 class Animation_Test:
@@ -91,3 +93,46 @@ class Animation_Test:
             AX += ph.transform.translate(x=1)
 
         A.render_all()
+
+    def threaded_render_test(self):
+
+        """ threaded_render_test:
+            Rendering the frames on several threads gives the same frames.
+        """
+
+        A1 = ph.Animation()
+        A1 += ph.circle(x=np.linspace(-1, 1, 10), mode="blend")
+        A1 += ph.rectangle(y=np.linspace(0, 1, 10), mode="add")
+        A2 = A1.blank()
+        A2.artist_stack = A1.artist_stack
+
+        A1.render_all()
+        A2.render_all(threads=4)
+
+        for f1, f2 in zip(A1.frames, A2.frames):
+            assert_true((f1.img == f2.img).all())
+
+    def bad_thread_env_test(self):
+
+        """ bad_thread_env_test:
+            An invalid PIXELHOUSE_THREADS warns and renders serially.
+        """
+
+        A = ph.Animation(duration=1)
+        A += ph.circle()
+
+        previous = os.environ.get("PIXELHOUSE_THREADS")
+        os.environ["PIXELHOUSE_THREADS"] = "auto"
+        try:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                A.render_all()
+        finally:
+            if previous is None:
+                del os.environ["PIXELHOUSE_THREADS"]
+            else:
+                os.environ["PIXELHOUSE_THREADS"] = previous
+
+        w = [x for x in w if "PIXELHOUSE_THREADS" in str(x.message)]
+        assert_equal(len(w), 1)
+        assert_true(all(A.has_rendered))
@@ -397,3 +397,150 @@ class Canvas_Test:
 
         assert_equal(C.rgb.mean(), 37)
         assert_equal(C.alpha.mean(), 37)
+
+    def blend_matches_integer_reference_test(self):
+        """ blend_matches_integer_reference_test:
+         The vectorised blend should agree with the integer form of
+         (rhs*a + img*(255-a)) / 255 on every backend (SSE/AVX2/NEON).
+        """
+        rng = np.random.RandomState(42)
+        img = rng.randint(0, 256, size=(37, 53, 4)).astype(np.uint8)
+        rhs_img = rng.randint(0, 256, size=(37, 53, 4)).astype(np.uint8)
+        rhs_img[:5, :, 3] = 0
+        rhs_img[-5:, :, 3] = 255
+
+        C = ph.Canvas(img=img.copy())
+        C.blend(ph.Canvas(img=rhs_img))
+
+        a = rhs_img[:, :, 3:].astype(int)
+        expected = (rhs_img * a + img * (255 - a) + 127) // 255
+
+        assert_true(np.abs(C.img.astype(int) - expected).max() <= 1)
+        assert_true((C.img[:5] == img[:5]).all())
+        assert_true((C.img[-5:] == rhs_img[-5:]).all())
+
+    def transform_xy_matches_scalar_test(self):
+        """ transform_xy_matches_scalar_test:
+         The vectorised point transform agrees with transform_x/transform_y.
+        """
+        C = ph.Canvas(width=300, height=150, extent=3.0)
+        xs = [-3.0, -1.25, 0.0, 0.7, 2.9]
+        ys = [1.5, 0.3, 0.0, -0.45, -1.4]
+
+        px, py = C.transform_xy(xs, ys, use_shift=True)
+
+        assert_equal(px.tolist(), [C.transform_x(x, True, True) for x in xs])
+        assert_equal(py.tolist(), [C.transform_y(y, True, True) for y in ys])
+
+    def blend_opaque_and_transparent_test(self):
+        """ blend_opaque_and_transparent_test:
+         A fully transparent mask leaves the canvas alone, a fully
+         opaque one replaces it.
+        """
+        C1 = ph.Canvas(bg="yellow")
+        C1 += ph.circle(color="g")
+        img = C1.img.copy()
+
+        C2 = C1.copy(transparent=True)
+        C1.blend(C2)
+        assert_true((C1.img == img).all())
+
+        C2.img = [10, 20, 30, 255]
+        C1.blend(C2)
+        assert_true((C1.img == C2.img).all())
+
+    def copy_into_test(self):
+        """ copy_into_test:
+         Copy the image into a preallocated buffer and reuse it.
+        """
+        C = ph.Canvas(bg="yellow")
+        C += ph.circle(color="g")
+
+        out = np.zeros_like(C.img)
+        assert_true(C.copy_into(out) is out)
+        assert_true((out == C.img).all())
+
+        C.copy().copy_into(out)
+        assert_true((out == C.img).all())
+
+    def transform_color_keeps_element_types_test(self):
+        """ transform_color_keeps_element_types_test:
+         An int color asked for after an equal float color comes back
+         as ints (PIL can't draw with float colors).
+        """
+        C = ph.Canvas()
+        C += ph.circle(color=(255.0, 0, 0))
+
+        c = C.transform_color((255, 0, 0))
+        assert_equal(c, (255, 0, 0, 255))
+        assert_true(all(isinstance(x, int) for x in c))
+
+    @raises(ValueError)
+    def bad_mode_offscreen_draw_test(self):
+        C = ph.Canvas()
+        C += ph.circle(x=50, mode="NothingToSeeHere")
+
+    def draw_blend_on_strided_img_test(self):
+        """ draw_blend_on_strided_img_test:
+         Blend-mode draws onto a canvas wrapping a strided or
+         channel-reversed array must not be lost.
+        """
+        big = np.zeros((400, 400, 4), np.uint8)
+
+        for img in [big[::2, ::2], big[:200, :200, ::-1]]:
+            C = ph.Canvas(img=img)
+            C += ph.circle(color="r", mode="blend")
+            assert_true(C.img.sum() > 0)
+
+    def blend_weights_cache_limit_test(self):
+        """ blend_weights_cache_limit_test:
+         Blend weight buffers above the size limit are not kept around.
+        """
+        limit = ph.canvas._SCRATCH_PIXELS
+
+        w1, w2 = ph.canvas._blend_weights(2, limit)
+        assert_equal(w1.shape, (2, limit))
+
+        cached = getattr(ph.canvas._scratch, "weights", None)
+        assert_true(cached is None or cached.shape[1] <= limit)
+
+    def copy_keeps_dtype_test(self):
+        """ copy_keeps_dtype_test:
+         Copying a canvas that wraps a non-uint8 image keeps its dtype.
+        """
+        img = np.full((20, 20, 4), 0.5, np.float32)
+        C = ph.Canvas(img=img).copy()
+
+        assert_equal(C.img.dtype, np.float32)
+        assert_true(np.array_equal(C.img, img))
+        assert_false(C.img is img)
+
+    def blend_non_uint8_test(self):
+        """ blend_non_uint8_test:
+         Blending onto a float image falls back to the float blend.
+        """
+        C = ph.Canvas(img=np.full((20, 20, 4), 100, np.float32))
+        rhs = ph.Canvas(20, 20)
+        rhs.img[:] = (200, 0, 0, 255)
+        rhs.alpha[:10] = 0
+
+        C.blend(rhs)
+        assert_equal(C.img.dtype, np.uint8)
+        assert_true((C.img[:10] == 100).all())
+        assert_true((C.img[10:] == (200, 0, 0, 255)).all())
+
+    def transform_non_square_test(self):
+        """ transform_non_square_test:
+         On a non-square canvas round coordinates map to exact pixels,
+         e.g. y=1 on 300x200 is 62.5 pixels from the top.
+        """
+        C = ph.Canvas(width=300, height=200)
+
+        assert_equal(C.transform_y(1), 62)
+        assert_equal(C.transform_y(1, use_shift=True), 16000)
+        assert_equal(C.transform_y(-1.5, use_shift=True), 40000)
+        assert_equal(C.transform_x(1, use_shift=True), 48000)
+
+        px, py = C.transform_xy([1, -2], [1, -1.5], use_shift=True)
+        assert_equal(px.tolist(), [48000, 19200])
+        assert_equal(py.tolist(), [16000, 40000])
@@ -113,3 +113,35 @@ class Primitive_Text_Options_Test:
         # Now check that none of them are equal
         for x, y in itertools.combinations([C0, C1, C2], r=2):
             assert_false((x.img == y.img).all())
+
+
+class Primitive_Bounding_Box_Test:
+    def bounding_box_matches_full_frame_test(self):
+        """ bounding_box_matches_full_frame_test:
+            Drawing into the bounding box only must match drawing directly
+            onto a full blank canvas and combining it.
+        """
+        shapes = [
+            ph.circle(x=0.3, y=-0.2, r=0.7, color=[200, 10, 50, 180]),
+            ph.circle(x=3.9, r=0.5, thickness=0.1),
+            ph.rectangle(x=-1, y=1, x1=0.2, y1=-0.3, color="b"),
+            ph.line(x=-3, y=-2, x1=2, y1=1, thickness=0.3),
+            ph.ellipse(a=1.2, b=0.4, rotation=0.7, color="g"),
+            ph.polyline(xpts=[0, 1, -2], ypts=[0, 1.2, 0.5], is_filled=1),
+        ]
+
+        ITR = itertools.product(shapes, ["blend", "add"], ["black", "gray"])
+        for art, mode, bg in ITR:
+            C1 = ph.Canvas(bg=bg)
+            C1.rgb = 40
+            C2 = C1.copy()
+
+            art.mode = ph.artist.constant(mode)
+            C1 += art
+
+            rhs = C2.blank()
+            art.mode = ph.artist.constant("direct")
+            rhs += art
+            C2.combine(rhs, mode)
+
+            assert_true((C1.img == C2.img).all())